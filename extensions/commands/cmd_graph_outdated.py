@@ -7,141 +7,257 @@ in a Conan dependency graph.
 Replicates the `conan graph outdated` command from conan-io/conan.
 """
 
+import copy
+import io
 import json
 import os
+import sqlite3
+import sys
+import threading
+import time
+from ast import literal_eval
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing, contextmanager, redirect_stdout
+from itertools import groupby, islice
+from operator import itemgetter
 
 from conan.api.output import cli_out_write, ConanOutput, Color
 from conan.api.model.refs import PkgReference, RecipeReference
 from conan.cli.args import common_graph_args, validate_common_graph_args
 from conan.cli.command import conan_command
-from conan.cli.printers.graph import print_graph_basic
 from conan.errors import ConanException
 
-def _print_skipped_packages(skipped, label="Packages without revision (not yet installed):"):
-    """Helper to print packages without revision info."""
-    cli_out_write(label, fg=Color.BRIGHT_YELLOW)
+try:
+    from conan.internal.errors import ConanConnectionError, NotFoundException
+except ImportError:  # Conan < 2.10
+    from conans.errors import ConanConnectionError, NotFoundException
+
+# Upper bound of concurrent requests to the remotes
+_MAX_WORKERS = 32
+
+# Remote lookups are kept in the Conan home between invocations, for a few minutes
+_CACHE_FILENAME = "graph_outdated_cache.sqlite"
+_CACHE_TTL = 5 * 60
+
+_json_encoder = json.JSONEncoder(separators=(",", ":"))
+
+# Text output colors and headers
+_CYAN, _RED, _GREEN, _YELLOW, _MAGENTA = (Color.BRIGHT_CYAN, Color.BRIGHT_RED, Color.BRIGHT_GREEN,
+                                          Color.BRIGHT_YELLOW, Color.BRIGHT_MAGENTA)
+_RECIPE_REVISIONS_HEADER = "======== Recipe revisions ========"
+_PACKAGE_REVISIONS_HEADER = "======== Package revisions ========"
+_OUTDATED_HEADER = "======== Outdated dependencies ========"
+_NOT_FOUND_LINE = "    Latest in remote(s):  Not found in remotes"
+
+
+def _json_writer():
+    """
+    Return ``(write_text, write_json)`` functions writing to stdout, using the fastest
+    available compact json serializer. With orjson installed, its bytes are written
+    straight to the stdout binary buffer, without decoding and encoding them again.
+    """
+    # Imported here, custom commands are loaded on every conan invocation
+    try:
+        import orjson
+    except ImportError:  # orjson is optional, it only makes the json output faster
+        orjson = None
+    buffer = getattr(sys.stdout, "buffer", None)  # not available if stdout is redirected
+    if orjson is None or buffer is None:
+        write = sys.stdout.write
+        if orjson is None:
+            encode = _json_encoder.encode
+        else:
+            def encode(obj):
+                return orjson.dumps(obj).decode("utf-8")
+        return write, lambda obj: write(encode(obj))
+
+    sys.stdout.flush()  # Keep the order with anything already written as text
+    write = buffer.write
+    dumps = orjson.dumps
+    return lambda text: write(text.encode("utf-8")), lambda obj: write(dumps(obj))
+
+
+def _write_json_object(items, write_text, write_json):
+    """Write a json object from its (key, value) items, one item at a time."""
+    write_text("{")
+    separator = ""
+    for key, value in items:
+        write_text(separator)
+        write_json(key)
+        write_text(":")
+        write_json(value)
+        separator = ","
+    write_text("}")
+
+
+def _write_json_revisions(name, entries, skipped, not_checked=None):
+    """Write the json output of a revisions check, streaming its entries to stdout."""
+    write_text, write_json = _json_writer()
+    write_text(f'{{"{name}":')
+    _write_json_object(entries, write_text, write_json)
+    write_text(',"skipped_no_revision":')
+    write_json(skipped)
+    if not_checked is not None:
+        write_text(',"not_checked":')
+        write_json(not_checked)
+    write_text("}\n")
+
+
+def _skipped_packages_lines(lines, skipped, label):
+    """Helper to add the lines of packages without revision info."""
+    lines.append((label, _YELLOW))
     for pkg in skipped:
-        cli_out_write(f"    {pkg}", fg=Color.BRIGHT_CYAN)
+        lines.append((f"    {pkg}", _CYAN))
+
+
+def _current_versions(cache_refs):
+    """Unique cache versions as strings, keeping their original order."""
+    return list(dict.fromkeys(str(v) for v in cache_refs))
+
+
+class _TextBuffer(io.StringIO):
+    """Text buffer reporting the tty status of the stream its contents are written to."""
+
+    def __init__(self, stream):
+        super().__init__()
+        isatty = getattr(stream, "isatty", None)
+        self._isatty = bool(isatty and isatty())  # checked once, not for every line
+
+    def isatty(self):
+        return self._isatty
+
+
+def _write_lines(lines):
+    """Write (text, color) lines to stdout at once, grouping consecutive same color lines."""
+    # cli_out_write still does the coloring (it knows if colors are enabled), but into
+    # a buffer, so the whole output goes to stdout at once. The buffer looks like the
+    # real stdout to the colors check, so the colors are kept only when it is a terminal
+    buffer = _TextBuffer(sys.stdout)
+    with redirect_stdout(buffer):
+        for color, group in groupby(lines, key=itemgetter(1)):
+            cli_out_write("\n".join(text for text, _ in group), fg=color)
+    sys.stdout.write(buffer.getvalue())
 
 
 def outdated_text_formatter(result):
-    # Check if this is a recipe revision check result
-    if isinstance(result, dict) and result.get("_recipe_revisions"):
-        data = result.get("data", {})
-        recipes = data.get("recipes", {})
-        skipped = data.get("skipped", [])
-        cli_out_write("======== Recipe revisions ========", fg=Color.BRIGHT_MAGENTA)
+    lines = []
+    _outdated_text_lines(result, lines)
+    _write_lines(lines)
 
-        if len(recipes) == 0 and len(skipped) == 0:
-            cli_out_write("No recipes in graph", fg=Color.BRIGHT_YELLOW)
-            return
 
-        if len(recipes) == 0 and len(skipped) > 0:
-            cli_out_write("No recipes with revision info in graph", fg=Color.BRIGHT_YELLOW)
-            _print_skipped_packages(skipped, label="Recipes without revision (not yet installed):")
-            return
+def _revision_checks_lines(lines, header, kind, checks, skipped, not_checked=None):
+    """Add the (text, color) lines of a package or recipe revisions check result."""
+    skipped_label = f"{kind.capitalize()} without revision (not yet installed):"
+    lines.append((header, _MAGENTA))
 
-        for key, value in recipes.items():
-            is_outdated = value.get("is_outdated", False)
-            status = "OUTDATED" if is_outdated else "UP-TO-DATE"
-            status_color = Color.BRIGHT_RED if is_outdated else Color.BRIGHT_GREEN
-            cli_out_write(f"{key} [{status}]", fg=status_color)
-            cli_out_write(
-                f'    Current revision:  {value["current_rrev"]}',
-                fg=Color.BRIGHT_CYAN)
-            latest_remote = value.get("latest_remote")
-            if latest_remote:
-                cli_out_write(
-                    f'    Latest in remote(s):  {latest_remote["rrev"]} - {latest_remote["remote"]}',
-                    fg=Color.BRIGHT_CYAN)
-            else:
-                cli_out_write(
-                    '    Latest in remote(s):  Not found in remotes',
-                    fg=Color.BRIGHT_CYAN)
-
-        if len(skipped) > 0:
-            cli_out_write("", fg=Color.BRIGHT_YELLOW)
-            _print_skipped_packages(skipped, label="Recipes without revision (not yet installed):")
+    if not_checked is not None:
+        lines.append((f"Not checked: {not_checked}", _YELLOW))
         return
 
-    # Check if this is a package revision check result
-    if isinstance(result, dict) and result.get("_revisions"):
-        data = result.get("data", {})
-        packages = data.get("packages", {})
-        skipped = data.get("skipped", [])
-        cli_out_write("======== Package revisions ========", fg=Color.BRIGHT_MAGENTA)
+    if not checks and not skipped:
+        lines.append((f"No {kind} in graph", _YELLOW))
+        return
 
-        if len(packages) == 0 and len(skipped) == 0:
-            cli_out_write("No packages in graph", fg=Color.BRIGHT_YELLOW)
-            return
+    if not checks:
+        lines.append((f"No {kind} with revision info in graph", _YELLOW))
+        _skipped_packages_lines(lines, skipped, label=skipped_label)
+        return
 
-        if len(packages) == 0 and len(skipped) > 0:
-            cli_out_write("No packages with revision info in graph", fg=Color.BRIGHT_YELLOW)
-            _print_skipped_packages(skipped)
-            return
+    for key, value in checks.items():
+        is_outdated = value.is_outdated
+        status = "OUTDATED" if is_outdated else "UP-TO-DATE"
+        status_color = _RED if is_outdated else _GREEN
+        lines.append((f"{key} [{status}]", status_color))
+        lines.append((
+            f'    Current revision:  {value.current_revision}',
+            _CYAN))
+        latest_remote = value.latest_remote
+        if latest_remote:
+            lines.append((
+                f'    Latest in remote(s):  {latest_remote.revision} - {latest_remote.remote}',
+                _CYAN))
+        else:
+            lines.append((_NOT_FOUND_LINE, _CYAN))
+
+    if skipped:
+        lines.append(("", _YELLOW))
+        _skipped_packages_lines(lines, skipped, label=skipped_label)
+
+
+def _outdated_text_lines(result, lines):
+    """Add the (text, color) lines of the text output of the result."""
+    # Check if this is a recipe revision check result
+    if isinstance(result, dict) and result.get("_recipe_revisions"):
+        data = result.get("data", {})
+        _revision_checks_lines(lines, _RECIPE_REVISIONS_HEADER, "recipes",
+                               data.get("recipes", {}), data.get("skipped", []),
+                               data.get("not_checked"))
+        return
 
-        for key, value in packages.items():
-            is_outdated = value.get("is_outdated", False)
-            status = "OUTDATED" if is_outdated else "UP-TO-DATE"
-            status_color = Color.BRIGHT_RED if is_outdated else Color.BRIGHT_GREEN
-            cli_out_write(f"{key} [{status}]", fg=status_color)
-            cli_out_write(
-                f'    Current revision:  {value["current_prev"]}',
-                fg=Color.BRIGHT_CYAN)
-            latest_remote = value.get("latest_remote")
-            if latest_remote:
-                cli_out_write(
-                    f'    Latest in remote(s):  {latest_remote["prev"]} - {latest_remote["remote"]}',
-                    fg=Color.BRIGHT_CYAN)
-            else:
-                cli_out_write(
-                    '    Latest in remote(s):  Not found in remotes',
-                    fg=Color.BRIGHT_CYAN)
-
-        if len(skipped) > 0:
-            cli_out_write("", fg=Color.BRIGHT_YELLOW)
-            _print_skipped_packages(skipped)
+    # Check if this is a package revision check result
+    if isinstance(result, dict) and result.get("_revisions"):
+        data = result.get("data", {})
+        _revision_checks_lines(lines, _PACKAGE_REVISIONS_HEADER, "packages",
+                               data.get("packages", {}), data.get("skipped", []),
+                               data.get("not_checked"))
         return
 
     # Original outdated versions formatter
-    cli_out_write("======== Outdated dependencies ========", fg=Color.BRIGHT_MAGENTA)
+    lines.append((_OUTDATED_HEADER, _MAGENTA))
 
-    if len(result) == 0:
-        cli_out_write("No outdated dependencies in graph", fg=Color.BRIGHT_YELLOW)
+    if not result:
+        lines.append(("No outdated dependencies in graph", _YELLOW))
         return
 
     for key, value in result.items():
-        current_versions_set = list({str(v) for v in value["cache_refs"]})
-        cli_out_write(key, fg=Color.BRIGHT_YELLOW)
-        cli_out_write(
-            f'    Current versions:  {", ".join(current_versions_set) if value["cache_refs"] else "No version found in cache"}',
-            fg=Color.BRIGHT_CYAN)
+        current_versions = _current_versions(value["cache_refs"])
+        lines.append((key, _YELLOW))
+        lines.append((
+            f'    Current versions:  {", ".join(current_versions) if current_versions else "No version found in cache"}',
+            _CYAN))
         latest_remote = value.get("latest_remote")
         if latest_remote:
-            cli_out_write(
+            lines.append((
                 f'    Latest in remote(s):  {latest_remote["ref"]} - {latest_remote["remote"]}',
-                fg=Color.BRIGHT_CYAN)
+                _CYAN))
         if value["version_ranges"]:
-            cli_out_write(f'    Version ranges: ' + str(value["version_ranges"])[1:-1],
-                          fg=Color.BRIGHT_CYAN)
+            lines.append((f'    Version ranges: {", ".join(map(str, value["version_ranges"]))}',
+                          _CYAN))
+
+
+def _json_revision_entry(value):
+    """Json entry for a package or recipe revision check result."""
+    latest_remote = value.latest_remote
+    return {"current_revision": value.current_revision,
+            "is_outdated": value.is_outdated,
+            "latest_remote": None if latest_remote is None
+            else {"revision": latest_remote.revision,
+                  "remote": latest_remote.remote}}
+
+
+def _json_outdated_entry(value, _str=str):
+    """Json entry for an outdated versions result."""
+    latest_remote = value["latest_remote"]
+    return {"current_versions": _current_versions(value["cache_refs"]),
+            "version_ranges": [_str(r) for r in value["version_ranges"]],
+            "latest_remote": None if latest_remote is None
+            else {"ref": _str(latest_remote["ref"]),
+                  "remote": _str(latest_remote["remote"])}}
 
 
 def outdated_json_formatter(result):
+    # The output entries are generated and written one at a time, instead of building
+    # the whole output and its serialized string in memory
+
     # Check if this is a recipe revision check result
     if isinstance(result, dict) and result.get("_recipe_revisions"):
         data = result.get("data", {})
         recipes = data.get("recipes", {})
         skipped = data.get("skipped", [])
-        output = {
-            "recipes": {key: {"current_revision": value["current_rrev"],
-                              "is_outdated": value.get("is_outdated", False),
-                              "latest_remote": None if value["latest_remote"] is None
-                              else {"revision": value["latest_remote"]["rrev"],
-                                    "remote": value["latest_remote"]["remote"]}}
-                        for key, value in recipes.items()},
-            "skipped_no_revision": skipped
-        }
-        cli_out_write(json.dumps(output))
+        _write_json_revisions("recipes",
+                              ((key, _json_revision_entry(value))
+                               for key, value in recipes.items()),
+                              skipped, data.get("not_checked"))
         return
 
     # Check if this is a package revision check result
@@ -149,176 +265,439 @@ def outdated_json_formatter(result):
         data = result.get("data", {})
         packages = data.get("packages", {})
         skipped = data.get("skipped", [])
-        output = {
-            "packages": {key: {"current_revision": value["current_prev"],
-                              "is_outdated": value.get("is_outdated", False),
-                              "latest_remote": None if value["latest_remote"] is None
-                              else {"revision": value["latest_remote"]["prev"],
-                                    "remote": value["latest_remote"]["remote"]}}
-                        for key, value in packages.items()},
-            "skipped_no_revision": skipped
-        }
-        cli_out_write(json.dumps(output))
+        _write_json_revisions("packages",
+                              ((key, _json_revision_entry(value))
+                               for key, value in packages.items()),
+                              skipped, data.get("not_checked"))
         return
 
     # Original outdated versions formatter
-    output = {key: {"current_versions": list({str(v) for v in value["cache_refs"]}),
-                    "version_ranges": [str(r) for r in value["version_ranges"]],
-                    "latest_remote": None if value["latest_remote"] is None
-                    else {"ref": str(value["latest_remote"]["ref"]),
-                          "remote": str(value["latest_remote"]["remote"])}}
-              for key, value in result.items()}
-    cli_out_write(json.dumps(output))
+    write_text, write_json = _json_writer()
+    _write_json_object(((key, _json_outdated_entry(value)) for key, value in result.items()),
+                       write_text, write_json)
+    write_text("\n")
+
+
+def _write_ndjson(records):
+    """Write one compact json object per line, as each record is generated."""
+    write_text, write_json = _json_writer()
+    for record in records:
+        write_json(record)
+        write_text("\n")
+
 
+def _ndjson_revision_records(checks, skipped, not_checked=None):
+    """Json lines of a package or recipe revisions check result."""
+    if not_checked is not None:
+        yield {"not_checked": not_checked}
+    for key, value in checks.items():
+        yield {"ref": key, **_json_revision_entry(value)}
+    for ref in skipped:
+        yield {"ref": ref, "skipped_no_revision": True}
 
-def check_outdated_revisions(conan_api, deps_graph, remotes):
+
+def outdated_ndjson_formatter(result):
+    # Newline delimited json, one object per package, recipe or dependency, so the
+    # output can be consumed line by line (e.g. by jq) without parsing it as a whole
+
+    # Check if this is a recipe revision check result
+    if isinstance(result, dict) and result.get("_recipe_revisions"):
+        data = result.get("data", {})
+        _write_ndjson(_ndjson_revision_records(data.get("recipes", {}), data.get("skipped", []),
+                                               data.get("not_checked")))
+        return
+
+    # Check if this is a package revision check result
+    if isinstance(result, dict) and result.get("_revisions"):
+        data = result.get("data", {})
+        _write_ndjson(_ndjson_revision_records(data.get("packages", {}), data.get("skipped", []),
+                                               data.get("not_checked")))
+        return
+
+    # Original outdated versions result
+    _write_ndjson({"name": key, **_json_outdated_entry(value)} for key, value in result.items())
+
+
+class _RemoteRevision:
+    """Latest revision of a reference found in the remotes."""
+    __slots__ = ("revision", "remote", "timestamp")
+
+    def __init__(self, revision, remote, timestamp):
+        self.revision = revision
+        self.remote = remote  # remote name
+        self.timestamp = timestamp
+
+
+class _RevisionCheck:
+    """Revision comparison of a package or recipe in the graph with the remotes."""
+    __slots__ = ("current_revision", "latest_remote", "is_outdated")
+
+    def __init__(self, current_revision):
+        self.current_revision = current_revision
+        self.latest_remote = None  # _RemoteRevision, None if not found in the remotes
+        self.is_outdated = False
+
+
+@contextmanager
+def _use_executor(executor, max_workers):
+    """Use the given executor, or a new one (shut down on exit) if None."""
+    if executor is not None:
+        yield executor
+        return
+    with ThreadPoolExecutor(max_workers=max_workers) as new_executor:
+        yield new_executor
+
+
+def _latest_revisions(executor, latest_revision, queries):
+    """
+    Find the latest revision in the remotes of each of the given references.
+
+    ``queries`` maps a key to a ``(reference, remotes)`` tuple. All the
+    ``latest_revision(reference, remote=remote)`` lookups are submitted to the
+    executor at once, as they are blocking requests to the remotes, and then reduced
+    here in remotes order, so on equal timestamps the first remote wins. If that
+    fails, the pending lookups are cancelled before raising.
+
+    Returns a dict of key to _RemoteRevision for the references found in any remote.
+    """
+    futures = {}
+    try:
+        for key, (ref, remotes) in queries.items():
+            remote_futures = futures[key] = []
+            for remote in remotes:
+                remote_futures.append((remote.name,
+                                       executor.submit(latest_revision, ref, remote=remote)))
+
+        result = {}
+        for key, remote_futures in futures.items():
+            best_rev = best_remote = best_ts = None
+            for remote_name, future in remote_futures:
+                try:
+                    latest = future.result()
+                except (NotFoundException, ConanConnectionError):
+                    # Not found in this remote or connection error, continue to next
+                    continue
+                if latest is None:
+                    continue
+
+                # Keep this revision if it is newer than what we have
+                latest_timestamp = latest.timestamp
+                if best_remote is None or (latest_timestamp is not None and
+                                           (best_ts is None or latest_timestamp > best_ts)):
+                    best_rev = latest.revision
+                    best_remote = remote_name
+                    best_ts = latest_timestamp
+
+            if best_remote is not None:
+                result[key] = _RemoteRevision(best_rev, best_remote, best_ts)
+        return result
+    except BaseException:
+        # On any error (or Ctrl+C) drop the lookups that didn't start, otherwise the
+        # executor shutdown would wait for all of them to be done
+        for remote_futures in futures.values():
+            for _, future in remote_futures:
+                future.cancel()
+        raise
+
+
+class _RemoteLogin:
+    """
+    Let the first request to each remote finish before the other ones to it start.
+
+    Conan logs in to a remote (asking for the credentials if needed) from the request
+    that gets an authentication error, and its authentication manager isn't thread
+    safe. With the first request done alone, the concurrent ones find the token
+    already stored, instead of racing to log in and prompting several times.
+
+    A remote only counts as logged in once a request to it succeeds or finds nothing.
+    After any other error (e.g. a failed login) its requests keep running one at a
+    time, so they can't race to log in either.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._remote_locks = {}
+        self._logged = set()
+
+    def wrap(self, lookup):
+        """Wrap a ``lookup(ref, remote=remote)`` request to the remotes."""
+        def lookup_after_login(ref, remote):
+            if remote.name not in self._logged:
+                with self._lock:
+                    remote_lock = self._remote_locks.setdefault(remote.name, threading.Lock())
+                with remote_lock:
+                    if remote.name not in self._logged:
+                        try:
+                            result = lookup(ref, remote=remote)
+                        except NotFoundException:
+                            # The remote answered, so the login (if any) went through
+                            self._logged.add(remote.name)
+                            raise
+                        self._logged.add(remote.name)
+                        return result
+            return lookup(ref, remote=remote)
+
+        return lookup_after_login
+
+
+class _RemoteLookupCache:
+    """
+    Persistent cache of remote lookups results, shared between invocations.
+
+    Entries expire after ``ttl`` seconds, so new revisions uploaded to the remotes
+    are found again, and the expired ones are deleted when the cache is opened. A
+    connection is opened per operation, which is negligible compared with the remote
+    requests, and makes it safe to use from the threads doing the lookups.
+
+    If the database can't be used (e.g. read-only Conan home, locked database) the
+    cache is disabled with a warning, and every lookup goes to the remotes.
+    """
+
+    def __init__(self, path, ttl=_CACHE_TTL):
+        self._path = path
+        self._ttl = ttl
+        self._enabled = True
+        try:
+            with closing(self._connect()) as connection, connection:
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute("CREATE TABLE IF NOT EXISTS lookups (key TEXT PRIMARY KEY, "
+                                   "value TEXT, timestamp REAL, fetched REAL)")
+                connection.execute("DELETE FROM lookups WHERE fetched < ?", (time.time() - ttl,))
+        except sqlite3.Error as e:
+            self._disable(e)
+
+    def _connect(self):
+        return sqlite3.connect(self._path, timeout=10)
+
+    def _disable(self, error):
+        if self._enabled:
+            self._enabled = False
+            ConanOutput().warning(f"Remote lookups cache {self._path} can't be used, "
+                                  f"querying the remotes: {error}")
+
+    def get(self, key):
+        """Return the (value, timestamp) stored for the key, or None if missing or expired."""
+        if not self._enabled:
+            return None
+        try:
+            with closing(self._connect()) as connection:
+                row = connection.execute("SELECT value, timestamp, fetched FROM lookups "
+                                         "WHERE key=?", (key,)).fetchone()
+        except sqlite3.Error as e:
+            self._disable(e)
+            return None
+        if row is None or time.time() - row[2] > self._ttl:
+            return None
+        return row[0], row[1]
+
+    def set(self, key, value, timestamp=None):
+        if not self._enabled:
+            return
+        try:
+            with closing(self._connect()) as connection, connection:
+                connection.execute("INSERT OR REPLACE INTO lookups VALUES (?, ?, ?, ?)",
+                                   (key, value, timestamp, time.time()))
+        except sqlite3.Error as e:
+            self._disable(e)
+
+
+def _persist_revision_lookup(lookup, cache):
+    """
+    Store the results of a ``lookup(ref, remote=remote)`` of the latest revision
+    in the persistent cache, and use them while they don't expire.
+
+    References not found in the remote are stored too, unreachable remotes are not.
+    """
+    def persisted_lookup(ref, remote):
+        # str() of the references doesn't have the recipe revision, the packages of
+        # different recipe revisions would share their entries
+        key = f"revision|{remote.url}|{ref.repr_notime()}"
+        cached = cache.get(key)
+        if cached is not None:
+            revision, timestamp = cached
+            if revision is None:  # Known to be missing in this remote
+                return None
+            latest = copy.copy(ref)
+            latest.revision = revision
+            latest.timestamp = timestamp
+            return latest
+
+        try:
+            latest = lookup(ref, remote=remote)
+        except NotFoundException:
+            latest = None
+        if latest is None:
+            cache.set(key, None)
+        else:
+            cache.set(key, latest.revision, latest.timestamp)
+        return latest
+
+    return persisted_lookup
+
+
+def _check_outdated(checks, latest_revision, refs, remotes, executor):
+    """
+    Common driver of the package and recipe revisions checks.
+
+    ``checks`` maps a key to its _RevisionCheck, and ``refs`` the same keys to the
+    reference to look up in the remotes. The latest revision found in the remotes is
+    set in each check, flagging it as outdated if it differs from the current one.
+    """
+    queries = {key: (ref, remotes) for key, ref in refs.items()}
+    with _use_executor(executor, min(_MAX_WORKERS, len(remotes) * len(refs))) as executor:
+        latest = _latest_revisions(executor, latest_revision, queries)
+
+    for key, latest_remote in latest.items():
+        check = checks[key]
+        check.latest_remote = latest_remote
+        check.is_outdated = latest_remote.revision != check.current_revision
+
+
+def _no_remotes_result(name):
+    """Result of a revisions check without remotes, so nothing was checked."""
+    return {name: {}, "skipped": [], "not_checked": "no remotes"}
+
+
+def check_outdated_revisions(conan_api, deps_graph, remotes, latest_package_revision=None,
+                             executor=None):
     """
     Check for outdated package revisions in the dependency graph.
 
     For each package in the graph, compare the current package revision
     with the latest revision available in the remotes.
 
+    ``latest_package_revision`` can be given to replace the remote lookup
+    (e.g. by a cached one), it defaults to ``conan_api.list.latest_package_revision``.
+    The lookups run in the given ``executor``, or in a new thread pool if None.
+
     Returns all packages with their revision comparison, allowing users to
     verify whether revisions match or differ.
     """
-    dependencies = deps_graph.nodes[1:]
+    if latest_package_revision is None:
+        latest_package_revision = _RemoteLogin().wrap(conan_api.list.latest_package_revision)
+    # Iterate the graph nodes without the root one, without copying the list
+    dependencies = islice(deps_graph.nodes, 1, None)
     package_revisions = {}
-    skipped_packages = []
+    skipped_packages = {}  # insertion ordered set, the same ref can appear several times
 
-    if len(dependencies) == 0:
-        return {"packages": package_revisions, "skipped": skipped_packages}
+    # Without remotes there is nothing to compare against
+    if not remotes:
+        return _no_remotes_result("packages")
+    if len(deps_graph.nodes) <= 1:
+        return {"packages": package_revisions, "skipped": list(skipped_packages)}
 
     ConanOutput().title("Checking package revisions in remotes")
 
+    # Filter the nodes with package revision info once
+    valid_nodes = []
     for node in dependencies:
         # Skip nodes without package info (e.g., virtual packages)
         if node.ref is None or node.package_id is None:
             continue
         if node.prev is None:
             # Track packages without revision info
-            skipped_packages.append(str(node.ref))
+            skipped_packages[str(node.ref)] = None
             continue
+        valid_nodes.append((node.ref, node.package_id, node.prev))
 
+    # Collect the packages to query first, so the remote lookups can be done concurrently
+    prefs = {}
+    built_prefs = {}  # repeated (ref, package_id) nodes share their package reference
+    for ref, package_id, current_prev in valid_nodes:
         # Build the package reference for querying
-        pref = PkgReference(ref=node.ref, package_id=node.package_id, revision=None)
-        pref_key = str(pref)  # name/version:package_id
-
-        current_prev = node.prev
+        pref = built_prefs.get((ref, package_id))
+        if pref is None:
+            pref = PkgReference(ref=ref, package_id=package_id, revision=None)
+            built_prefs[(ref, package_id)] = pref
+        pref_key = sys.intern(str(pref))  # name/version:package_id
 
         # Initialize entry for this package (each package is processed once)
-        package_revisions[pref_key] = {
-            "current_prev": current_prev,
-            "latest_remote": None,
-            "is_outdated": False
-        }
-
-        # Check each remote for package revisions
-        for remote in remotes:
-            try:
-                latest_pref = conan_api.list.latest_package_revision(pref, remote=remote)
-                if latest_pref is None:
-                    continue
+        package_revisions[pref_key] = _RevisionCheck(current_prev)
+        prefs[pref_key] = pref
 
-                latest_prev = latest_pref.revision
-                latest_timestamp = latest_pref.timestamp
-
-                # Update the latest revision info if this is newer than what we have
-                existing = package_revisions[pref_key]
-                existing_remote = existing["latest_remote"]
-                if existing_remote is None or (latest_timestamp is not None and
-                        (existing_remote["timestamp"] is None or
-                         latest_timestamp > existing_remote["timestamp"])):
-                    existing["latest_remote"] = {
-                        "prev": latest_prev,
-                        "remote": remote.name,
-                        "timestamp": latest_timestamp
-                    }
-                    existing["is_outdated"] = latest_prev != current_prev
-            except ConanException:
-                # Package not found in this remote or connection error, continue to next
-                continue
-
-    return {"packages": package_revisions, "skipped": skipped_packages}
-
-
-def check_outdated_recipe_revisions(conan_api, deps_graph, remotes):
+    if not prefs:
+        return {"packages": package_revisions, "skipped": list(skipped_packages)}
+
+    _check_outdated(package_revisions, latest_package_revision, prefs, remotes, executor)
+
+    return {"packages": package_revisions, "skipped": list(skipped_packages)}
+
+
+def check_outdated_recipe_revisions(conan_api, deps_graph, remotes, latest_recipe_revision=None,
+                                    executor=None):
     """
     Check for outdated recipe revisions in the dependency graph.
 
     For each recipe in the graph, compare the current recipe revision
     with the latest revision available in the remotes.
 
+    ``latest_recipe_revision`` can be given to replace the remote lookup
+    (e.g. by a cached one), it defaults to ``conan_api.list.latest_recipe_revision``.
+    The lookups run in the given ``executor``, or in a new thread pool if None.
+
     Returns all recipes with their revision comparison, allowing users to
     verify whether revisions match or differ.
     """
-    dependencies = deps_graph.nodes[1:]
+    if latest_recipe_revision is None:
+        latest_recipe_revision = _RemoteLogin().wrap(conan_api.list.latest_recipe_revision)
+    # Iterate the graph nodes without the root one, without copying the list
+    dependencies = islice(deps_graph.nodes, 1, None)
     recipe_revisions = {}
-    skipped_recipes = []
+    skipped_recipes = {}  # insertion ordered set, the same ref can appear several times
 
-    if len(dependencies) == 0:
-        return {"recipes": recipe_revisions, "skipped": skipped_recipes}
+    # Without remotes there is nothing to compare against
+    if not remotes:
+        return _no_remotes_result("recipes")
+    if len(deps_graph.nodes) <= 1:
+        return {"recipes": recipe_revisions, "skipped": list(skipped_recipes)}
 
     ConanOutput().title("Checking recipe revisions in remotes")
 
+    # Collect the recipes to query first, so the remote lookups can be done concurrently
+    refs = {}
     for node in dependencies:
         # Skip nodes without ref info (e.g., virtual packages)
         if node.ref is None:
             continue
 
         # Get the current recipe revision from the node
+        ref_key = sys.intern(str(node.ref))  # name/version[@user/channel]#revision
         current_rrev = node.ref.revision
         if current_rrev is None:
             # Track recipes without revision info
-            skipped_recipes.append(str(node.ref))
+            skipped_recipes[ref_key] = None
+            continue
+
+        # Initialize entry for this recipe (each recipe is processed once based on ref_key)
+        if ref_key in recipe_revisions:
             continue
 
         # Build the recipe reference for querying (without revision to query for latest)
         ref = RecipeReference(name=node.ref.name, version=node.ref.version,
                               user=node.ref.user, channel=node.ref.channel,
                               revision=None)
-        ref_key = str(node.ref)  # name/version[@user/channel]#revision
+        recipe_revisions[ref_key] = _RevisionCheck(current_rrev)
+        refs[ref_key] = ref
 
-        # Initialize entry for this recipe (each recipe is processed once based on ref_key)
-        if ref_key in recipe_revisions:
-            continue
+    if not refs:
+        return {"recipes": recipe_revisions, "skipped": list(skipped_recipes)}
 
-        recipe_revisions[ref_key] = {
-            "current_rrev": current_rrev,
-            "latest_remote": None,
-            "is_outdated": False
-        }
-
-        # Check each remote for recipe revisions
-        for remote in remotes:
-            try:
-                latest_ref = conan_api.list.latest_recipe_revision(ref, remote=remote)
-                if latest_ref is None:
-                    continue
-
-                latest_rrev = latest_ref.revision
-                latest_timestamp = latest_ref.timestamp
+    _check_outdated(recipe_revisions, latest_recipe_revision, refs, remotes, executor)
+    return {"recipes": recipe_revisions, "skipped": list(skipped_recipes)}
 
-                # Update the latest revision info if this is newer than what we have
-                existing = recipe_revisions[ref_key]
-                existing_remote = existing["latest_remote"]
-                if existing_remote is None or (latest_timestamp is not None and
-                        (existing_remote["timestamp"] is None or
-                         latest_timestamp > existing_remote["timestamp"])):
-                    existing["latest_remote"] = {
-                        "rrev": latest_rrev,
-                        "remote": remote.name,
-                        "timestamp": latest_timestamp
-                    }
-                    existing["is_outdated"] = latest_rrev != current_rrev
-            except ConanException:
-                # Recipe not found in this remote or connection error, continue to next
-                continue
 
-    return {"recipes": recipe_revisions, "skipped": skipped_recipes}
+def _parse_lockfile_overrides(value):
+    """Parse the --lockfile-overrides literal, without evaluating any code."""
+    try:
+        return literal_eval(value)
+    except (ValueError, SyntaxError, TypeError, RecursionError) as e:
+        # TypeError for unhashable keys (e.g. "{[1]: 2}"), RecursionError for deep nesting
+        raise ConanException(f"Invalid --lockfile-overrides value {value!r}: {e}")
 
 
 @conan_command(group="Custom commands", formatters={"text": outdated_text_formatter,
-                                                     "json": outdated_json_formatter})
+                                                     "json": outdated_json_formatter,
+                                                     "ndjson": outdated_ndjson_formatter})
 def graph_outdated(conan_api, parser, *args):
     """
     List the dependencies in the graph and their newer versions in the remote.
@@ -334,6 +713,9 @@ def graph_outdated(conan_api, parser, *args):
                         help="Check if there are recipe revision updates (instead of version updates)")
     parser.add_argument("--build-require", action='store_true', default=False,
                         help='Whether the provided reference is a build-require')
+    parser.add_argument("--no-cache", default=False, action="store_true",
+                        help="Do not reuse the revisions found in the remotes by previous runs "
+                             "(they are kept for a few minutes)")
     args = parser.parse_args(*args)
     # parameter validation
     validate_common_graph_args(args)
@@ -342,7 +724,7 @@ def graph_outdated(conan_api, parser, *args):
 
     # Basic collaborators, remotes, lockfile, profiles
     remotes = conan_api.remotes.list(args.remote) if not args.no_remote else []
-    overrides = eval(args.lockfile_overrides) if args.lockfile_overrides else None
+    overrides = _parse_lockfile_overrides(args.lockfile_overrides) if args.lockfile_overrides else None
     lockfile = conan_api.lockfile.get_lockfile(lockfile=args.lockfile,
                                                conanfile_path=path,
                                                cwd=cwd,
@@ -350,6 +732,15 @@ def graph_outdated(conan_api, parser, *args):
                                                overrides=overrides)
     profile_host, profile_build = conan_api.profiles.get_profiles_from_args(args)
 
+    # The lookups run concurrently, but the first one to each remote logs in alone
+    login = _RemoteLogin()
+    latest_package_revision = login.wrap(conan_api.list.latest_package_revision)
+    latest_recipe_revision = login.wrap(conan_api.list.latest_recipe_revision)
+    if not args.no_cache and (args.check_revisions or args.check_recipe_revisions):
+        cache = _RemoteLookupCache(os.path.join(conan_api.home_folder, _CACHE_FILENAME))
+        latest_package_revision = _persist_revision_lookup(latest_package_revision, cache)
+        latest_recipe_revision = _persist_revision_lookup(latest_recipe_revision, cache)
+
     if path:
         deps_graph = conan_api.graph.load_graph_consumer(path, args.name, args.version,
                                                          args.user, args.channel,
@@ -363,23 +754,38 @@ def graph_outdated(conan_api, parser, *args):
                                                          remotes, args.update,
                                                          check_updates=args.check_updates)
 
-    if args.check_revisions:
-        # Report graph errors (e.g., missing packages) before analyzing binaries
-        deps_graph.report_graph_error()
-        # Analyze binaries to compute package_ids and revisions for all packages in the graph
-        # This is required before checking revision updates, as load_graph_* only loads recipes
-        conan_api.graph.analyze_binaries(deps_graph, args.build, remotes=remotes,
-                                         update=args.update, lockfile=lockfile)
-        # Check for outdated package revisions instead of version updates
-        outdated = check_outdated_revisions(conan_api, deps_graph, remotes)
-        return {"_revisions": True, "data": outdated}
-
-    if args.check_recipe_revisions:
-        # Report graph errors (e.g., missing recipes) before checking revisions
-        deps_graph.report_graph_error()
-        # Check for outdated recipe revisions instead of version updates
-        outdated = check_outdated_recipe_revisions(conan_api, deps_graph, remotes)
-        return {"_recipe_revisions": True, "data": outdated}
+    # A single thread pool for the remote lookups, shared by the checks (threads are only
+    # started when lookups are submitted)
+    with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+        if args.check_revisions:
+            # Report graph errors (e.g., missing packages) before analyzing binaries
+            deps_graph.report_graph_error()
+            if not remotes:
+                # Don't analyze binaries when there is no remote to check revisions in
+                ConanOutput().warning("No remotes available (or --no-remote used), "
+                                      "package revisions can't be checked")
+                return {"_revisions": True, "data": _no_remotes_result("packages")}
+            # Analyze binaries to compute package_ids and revisions for all packages in the graph
+            # This is required before checking revision updates, as load_graph_* only loads recipes
+            conan_api.graph.analyze_binaries(deps_graph, args.build, remotes=remotes,
+                                             update=args.update, lockfile=lockfile)
+            # Check for outdated package revisions instead of version updates
+            outdated = check_outdated_revisions(conan_api, deps_graph, remotes,
+                                                latest_package_revision=latest_package_revision,
+                                                executor=executor)
+            return {"_revisions": True, "data": outdated}
+
+        if args.check_recipe_revisions:
+            # Report graph errors (e.g., missing recipes) before checking revisions
+            deps_graph.report_graph_error()
+            if not remotes:
+                ConanOutput().warning("No remotes available (or --no-remote used), "
+                                      "recipe revisions can't be checked")
+            # Check for outdated recipe revisions instead of version updates
+            outdated = check_outdated_recipe_revisions(conan_api, deps_graph, remotes,
+                                                       latest_recipe_revision=latest_recipe_revision,
+                                                       executor=executor)
+            return {"_recipe_revisions": True, "data": outdated}
 
     # Data structure to store info per library
     # DO NOT USE this API call yet, it is not stable
@@ -1 +0,0 @@
-<Fetched Content>
\ No newline at end of file
@@ -0,0 +1,131 @@
+import importlib.util
+import os
+import time
+
+import pytest
+
+pytest.importorskip("conan")
+
+from conan.api.model.refs import PkgReference, RecipeReference  # noqa: E402
+
+
+def _load_command_module():
+    # Custom commands aren't an importable package, they are loaded by path as Conan does
+    path = os.path.join(os.path.dirname(__file__), os.pardir, "extensions", "commands",
+                        "cmd_graph_outdated.py")
+    spec = importlib.util.spec_from_file_location("cmd_graph_outdated", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+cmd = _load_command_module()
+
+
+class _Remote:
+    def __init__(self, name):
+        self.name = name
+        self.url = f"https://{name}.example.com"
+
+
+class _Lookup:
+    """latest_*_revision stand-in, answering from ``revisions`` or raising ``error``."""
+
+    def __init__(self, revisions=None, error=None):
+        self.revisions = revisions or {}
+        self.error = error
+        self.calls = []
+
+    def __call__(self, ref, remote):
+        self.calls.append((ref.repr_notime(), remote.name))
+        if self.error is not None:
+            raise self.error
+        revision, timestamp = self.revisions[ref.repr_notime()]
+        latest = PkgReference(ref.ref, ref.package_id)
+        latest.revision = revision
+        latest.timestamp = timestamp
+        return latest
+
+
+def _pref(recipe_revision, package_id="pid1"):
+    return PkgReference(RecipeReference("zlib", "1.2.13", revision=recipe_revision), package_id)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return cmd._RemoteLookupCache(str(tmp_path / "cache.sqlite"))
+
+
+def test_keys_differ_by_recipe_revision(cache):
+    remote = _Remote("remote1")
+    lookup = _Lookup({"zlib/1.2.13#rrev1:pid1": ("prev1", 10.0),
+                      "zlib/1.2.13#rrev2:pid1": ("prev2", 20.0)})
+    persisted = cmd._persist_revision_lookup(lookup, cache)
+
+    assert persisted(_pref("rrev1"), remote).revision == "prev1"
+    assert persisted(_pref("rrev2"), remote).revision == "prev2"
+    # Both are cached now, under their own key
+    assert persisted(_pref("rrev1"), remote).revision == "prev1"
+    assert persisted(_pref("rrev2"), remote).timestamp == 20.0
+    assert len(lookup.calls) == 2
+
+
+def test_not_found_is_cached(cache):
+    remote = _Remote("remote1")
+    lookup = _Lookup(error=cmd.NotFoundException("not found"))
+    persisted = cmd._persist_revision_lookup(lookup, cache)
+
+    assert persisted(_pref("rrev1"), remote) is None
+    assert persisted(_pref("rrev1"), remote) is None
+    assert len(lookup.calls) == 1
+
+
+def test_connection_error_is_not_cached(cache):
+    remote = _Remote("remote1")
+    lookup = _Lookup(error=cmd.ConanConnectionError("unreachable"))
+    persisted = cmd._persist_revision_lookup(lookup, cache)
+
+    for _ in range(2):
+        with pytest.raises(cmd.ConanConnectionError):
+            persisted(_pref("rrev1"), remote)
+    assert len(lookup.calls) == 2
+
+    lookup.error = None
+    lookup.revisions = {"zlib/1.2.13#rrev1:pid1": ("prev1", 10.0)}
+    assert persisted(_pref("rrev1"), remote).revision == "prev1"
+
+
+def test_entries_expire(tmp_path, monkeypatch):
+    path = str(tmp_path / "cache.sqlite")
+    cache = cmd._RemoteLookupCache(path, ttl=60)
+    remote = _Remote("remote1")
+    lookup = _Lookup({"zlib/1.2.13#rrev1:pid1": ("prev1", 10.0)})
+    persisted = cmd._persist_revision_lookup(lookup, cache)
+
+    assert persisted(_pref("rrev1"), remote).revision == "prev1"
+    assert persisted(_pref("rrev1"), remote).revision == "prev1"
+    assert len(lookup.calls) == 1
+
+    now = time.time()
+    monkeypatch.setattr(cmd.time, "time", lambda: now + 61)
+    lookup.revisions = {"zlib/1.2.13#rrev1:pid1": ("prev2", 30.0)}
+    assert persisted(_pref("rrev1"), remote).revision == "prev2"
+    assert len(lookup.calls) == 2
+
+    # Opening the cache again deletes the expired entries
+    monkeypatch.setattr(cmd.time, "time", lambda: now + 200)
+    cmd._RemoteLookupCache(path, ttl=60)
+    monkeypatch.setattr(cmd.time, "time", lambda: now)
+    assert cache.get(f"revision|{remote.url}|zlib/1.2.13#rrev1:pid1") is None
+
+
+def test_unusable_database_queries_the_remotes(tmp_path):
+    # A directory can't be opened as a database
+    cache = cmd._RemoteLookupCache(str(tmp_path))
+    remote = _Remote("remote1")
+    lookup = _Lookup({"zlib/1.2.13#rrev1:pid1": ("prev1", 10.0)})
+    persisted = cmd._persist_revision_lookup(lookup, cache)
+
+    assert persisted(_pref("rrev1"), remote).revision == "prev1"
+    assert persisted(_pref("rrev1"), remote).revision == "prev1"
+    assert len(lookup.calls) == 2